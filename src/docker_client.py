@@ -1,9 +1,18 @@
 import docker
 import psutil
 import time
-from typing import List, Dict, Optional
-from datetime import datetime
+import threading
+from typing import Callable, List, Dict, Optional, Tuple
+from datetime import datetime, timezone
 import os
+import re
+import json
+import socket
+
+
+# Shared cache keys (used when REDIS_URL is set), prefixed per Docker daemon
+CONTAINERS_CACHE_KEY = "docker:{daemon_id}:containers:all"
+INFO_CACHE_KEY = "docker:{daemon_id}:info"
 
 
 class DockerClient:
@@ -12,85 +21,428 @@ class DockerClient:
         self.client = docker.from_env()
         self.docker_socket = docker_socket
         
+        # Short-lived cache of the enriched container list
+        self._containers_cache: Optional[List[Dict]] = None
+        self._containers_cache_ts = 0.0
+        self._containers_cache_ttl = float(os.getenv("CONTAINERS_CACHE_TTL", "10"))
+        self._containers_cache_lock = threading.Lock()
+        
+        # Immutable per-container fields, keyed by container id
+        self._static_cache: Dict[str, Dict] = {}
+        
+        # Inspect-only fields (state, restart_count) per container id, reset with the list
+        self._state_cache: Dict[str, Dict] = {}
+        
+        # Cached daemon info
+        self._info_cache: Optional[Dict] = None
+        self._info_cache_ts = 0.0
+        self._info_cache_ttl = float(os.getenv("INFO_CACHE_TTL", "300"))
+        
+        # docker-py clients are not thread-safe, so worker threads get their own
+        self._thread_local = threading.local()
+        
+        # Last CPU sample per container: (total_usage, system_usage)
+        self._last_cpu_sample: Dict[str, tuple] = {}
+        
+        # Background stats streams: latest snapshot per container id, (stats, monotonic ts)
+        self._stats_streaming = os.getenv("STATS_STREAMING", "true").lower() == "true"
+        self._stats_stream_idle_timeout = float(os.getenv("STATS_STREAM_IDLE_TIMEOUT", "300"))
+        self._stats_max_streams = int(os.getenv("STATS_MAX_STREAMS", "50"))
+        # Streamed snapshots older than this are ignored in favour of a direct stats call
+        self._stats_max_age = float(os.getenv("STATS_MAX_AGE", "5"))
+        self._latest_stats: Dict[str, tuple] = {}
+        self._stats_last_access: Dict[str, float] = {}
+        self._stats_streams: Dict[str, threading.Thread] = {}
+        self._stats_streams_lock = threading.Lock()
+        
         # Test connection
         try:
             self.client.ping()
         except Exception as e:
             raise Exception(f"Failed to connect to Docker daemon: {e}")
-    
-    def get_containers(self, name_filter: Optional[str] = None) -> List[Dict]:
-        """Get all containers (running and stopped) with optional name filtering"""
-        containers = []
         
+        # one_shot stats need API 1.41+, older daemons get the regular snapshot
+        self._stats_one_shot = not docker.utils.version_lt(self.client.api.api_version, "1.41")
+        
+        # Prime psutil so later non-blocking cpu_percent calls have a baseline
+        psutil.cpu_percent(interval=None)
+        
+        # Optional Redis cache shared by all agent worker processes
+        self._redis = None
+        self._containers_cache_key = None
+        self._info_cache_key = None
+        # After a Redis error, skip it until this monotonic time
+        self._redis_retry_at = 0.0
+        self._redis_retry_delay = 30.0
+        redis_url = os.getenv("REDIS_URL")
+        if redis_url:
+            try:
+                import redis
+                # Short timeouts so a hung Redis falls back to the local cache quickly
+                redis_timeout = float(os.getenv("REDIS_TIMEOUT", "0.5"))
+                self._redis = redis.Redis.from_url(
+                    redis_url,
+                    socket_timeout=redis_timeout,
+                    socket_connect_timeout=redis_timeout
+                )
+            except ImportError:
+                print("REDIS_URL is set but the redis package is not installed, using local cache only")
+            except Exception as e:
+                print(f"Invalid Redis configuration ({e}), using local cache only")
+        
+        if self._redis is not None:
+            # Agents on different hosts may share one Redis, so keys carry the daemon id
+            daemon_id = self.client.info().get("ID") or socket.gethostname()
+            self._containers_cache_key = CONTAINERS_CACHE_KEY.format(daemon_id=daemon_id)
+            self._info_cache_key = INFO_CACHE_KEY.format(daemon_id=daemon_id)
+    
+    def _create_client(self) -> docker.DockerClient:
+        """Create an additional Docker client for use by another thread"""
+        # Reuse the negotiated API version to skip a /version round-trip per client
+        return docker.from_env(version=self.client.api.api_version)
+    
+    def _get_thread_client(self) -> docker.DockerClient:
+        """Get a Docker client owned by the current thread
+
+        All daemon calls go through this, since the API handlers run them on
+        worker threads and docker-py clients must not be shared across threads.
+        """
+        client = getattr(self._thread_local, "client", None)
+        if client is None:
+            client = self._create_client()
+            self._thread_local.client = client
+        return client
+    
+    def ping(self) -> bool:
+        """Check that the Docker daemon is reachable"""
+        return self._get_thread_client().ping()
+    
+    def _shared_cache_available(self) -> bool:
+        """Check whether the shared cache is configured and not backing off after an error"""
+        return self._redis is not None and time.monotonic() >= self._redis_retry_at
+    
+    def _shared_cache_failed(self, message: str):
+        """Log a shared cache error and stop using Redis for a while"""
+        print(f"{message}, using local cache for {self._redis_retry_delay:.0f}s")
+        self._redis_retry_at = time.monotonic() + self._redis_retry_delay
+    
+    def _shared_cache_get(self, key: str) -> Optional[Tuple[object, float]]:
+        """Get a value and its remaining TTL in seconds from the shared cache"""
+        if not self._shared_cache_available():
+            return None
+        try:
+            pipe = self._redis.pipeline()
+            pipe.get(key)
+            pipe.pttl(key)
+            value, remaining_ms = pipe.execute()
+            if value is None or remaining_ms <= 0:
+                return None
+            return json.loads(value), remaining_ms / 1000.0
+        except Exception as e:
+            self._shared_cache_failed(f"Error reading shared cache {key}: {e}")
+            return None
+    
+    def _shared_cache_set(self, key: str, value: object, ttl: float):
+        """Store a value in the shared cache"""
+        if not self._shared_cache_available():
+            return
+        try:
+            self._redis.set(key, json.dumps(value), px=max(1, int(ttl * 1000)))
+        except Exception as e:
+            self._shared_cache_failed(f"Error writing shared cache {key}: {e}")
+    
+    def _shared_cache_delete(self, key: str):
+        """Remove a value from the shared cache"""
+        if not self._shared_cache_available():
+            return
         try:
-            for container in self.client.containers.list(all=True):
-                container_name = container.name
+            self._redis.delete(key)
+        except Exception as e:
+            self._shared_cache_failed(f"Error deleting shared cache {key}: {e}")
+    
+    def _get_all_containers_cached(self) -> List[Dict]:
+        """Get all containers, reusing the cached list while it is fresh"""
+        with self._containers_cache_lock:
+            now = time.monotonic()
+            if (self._containers_cache is not None
+                    and now - self._containers_cache_ts < self._containers_cache_ttl):
+                return self._containers_cache
+            
+            # Another worker may have refreshed the list already
+            shared = self._shared_cache_get(self._containers_cache_key)
+            if shared is not None:
+                containers, remaining = shared
+                self._state_cache = {}
+                self._prune_cpu_samples(containers)
+                self._containers_cache = containers
+                self._containers_cache_ts = now - (self._containers_cache_ttl - remaining)
+                return containers
+            
+            containers = []
+            static_cache = {}
+            # Raw /containers/json entries already carry everything we need,
+            # unlike the high-level list which inspects every container
+            for container in self._get_thread_client().api.containers(all=True):
+                container_id = container["Id"]
                 
-                # Apply name filter if provided
-                if name_filter:
-                    # Support wildcard matching (simple pattern)
-                    if name_filter.startswith('*') and name_filter.endswith('*'):
-                        # *pattern* - contains pattern
-                        pattern = name_filter[1:-1]
-                        if pattern.lower() not in container_name.lower():
-                            continue
-                    elif name_filter.startswith('*'):
-                        # *pattern - ends with pattern
-                        pattern = name_filter[1:]
-                        if not container_name.lower().endswith(pattern.lower()):
-                            continue
-                    elif name_filter.endswith('*'):
-                        # pattern* - starts with pattern
-                        pattern = name_filter[:-1]
-                        if not container_name.lower().startswith(pattern.lower()):
-                            continue
-                    else:
-                        # exact match or contains
-                        if name_filter.lower() not in container_name.lower():
-                            continue
+                # Image, creation time and labels never change for a container id
+                static_info = self._static_cache.get(container_id)
+                if static_info is None:
+                    static_info = {
+                        "image": container["Image"],
+                        "created": datetime.fromtimestamp(container["Created"], timezone.utc).isoformat(),
+                        "labels": container.get("Labels") or {}
+                    }
+                static_cache[container_id] = static_info
                 
                 container_info = {
-                    "id": container.id,
-                    "name": container.name,
-                    "image": container.image.tags[0] if container.image.tags else container.image.id,
-                    "status": container.status,
-                    "created": container.attrs["Created"],
-                    "ports": self._format_ports(container.attrs["NetworkSettings"]["Ports"]),
-                    "labels": container.attrs["Config"]["Labels"] or {},
-                    "restart_count": container.attrs["RestartCount"],
-                    "state": container.attrs["State"]
+                    "id": container_id,
+                    "name": container["Names"][0].lstrip("/") if container.get("Names") else container_id[:12],
+                    "image": static_info["image"],
+                    "status": container["State"],
+                    "created": static_info["created"],
+                    "ports": self._format_ports(container.get("Ports")),
+                    "labels": static_info["labels"]
                 }
                 containers.append(container_info)
+            
+            # Keep only containers seen on this pass
+            self._static_cache = static_cache
+            self._state_cache = {}
+            self._prune_cpu_samples(containers)
+            self._containers_cache = containers
+            self._containers_cache_ts = now
+            self._shared_cache_set(self._containers_cache_key, containers, self._containers_cache_ttl)
+            return containers
+    
+    def _prune_cpu_samples(self, containers: List[Dict]):
+        """Forget CPU samples of containers that no longer exist"""
+        container_ids = {container["id"] for container in containers}
+        self._last_cpu_sample = {
+            cid: sample for cid, sample in self._last_cpu_sample.items() if cid in container_ids
+        }
+    
+    def invalidate_containers_cache(self):
+        """Drop the cached container list so the next call refreshes it"""
+        with self._containers_cache_lock:
+            self._containers_cache = None
+            self._state_cache = {}
+            self._shared_cache_delete(self._containers_cache_key)
+    
+    @staticmethod
+    def _pattern_to_regex(name_filter: str) -> str:
+        """Translate a simple wildcard pattern to a regex fragment"""
+        if name_filter.startswith('*') and name_filter.endswith('*'):
+            # *pattern* - contains pattern
+            return re.escape(name_filter[1:-1])
+        elif name_filter.startswith('*'):
+            # *pattern - ends with pattern
+            return re.escape(name_filter[1:]) + r"\Z"
+        elif name_filter.endswith('*'):
+            # pattern* - starts with pattern
+            return r"\A" + re.escape(name_filter[:-1])
+        else:
+            # exact match or contains
+            return re.escape(name_filter)
+    
+    def _compile_name_filter(self, patterns: List[str]) -> Callable[[str], bool]:
+        """Compile name patterns into a single case-insensitive matcher"""
+        regex = re.compile("|".join(f"(?:{self._pattern_to_regex(p)})" for p in patterns), re.IGNORECASE)
+        return lambda container_name: regex.search(container_name) is not None
+    
+    def _get_container_state(self, container_id: str) -> Dict:
+        """Get state and restart count, which only the inspect API provides"""
+        state_info = self._state_cache.get(container_id)
+        if state_info is None:
+            try:
+                inspect = self._get_thread_client().api.inspect_container(container_id)
+            except docker.errors.NotFound:
+                # Removed since the list was fetched
+                return {"restart_count": 0, "state": {}}
+            state_info = {
+                "restart_count": inspect["RestartCount"],
+                "state": inspect["State"]
+            }
+            self._state_cache[container_id] = state_info
+        return state_info
+    
+    def _shape_container(self, container: Dict, excluded: set, include_state: bool) -> Dict:
+        """Drop opted-out fields and add inspect-only fields when requested"""
+        if excluded:
+            container = {k: v for k, v in container.items() if k not in excluded}
+        if include_state:
+            container = {**container, **self._get_container_state(container["id"])}
+        return container
+    
+    @staticmethod
+    def _excluded_fields(include_labels: bool, include_ports: bool) -> set:
+        """Get the heavy container fields the caller opted out of"""
+        excluded = set()
+        if not include_labels:
+            excluded.add("labels")
+        if not include_ports:
+            excluded.add("ports")
+        return excluded
+    
+    def get_containers(
+        self,
+        name_filter: Optional[str] = None,
+        *,
+        include_state: bool = True,
+        include_labels: bool = True,
+        include_ports: bool = True
+    ) -> List[Dict]:
+        """Get all containers (running and stopped) with optional name filtering"""
+        containers = []
+        excluded = self._excluded_fields(include_labels, include_ports)
+        
+        try:
+            matches = self._compile_name_filter([name_filter]) if name_filter else None
+            for container in self._get_all_containers_cached():
+                # Apply name filter if provided
+                if matches and not matches(container["name"]):
+                    continue
+                
+                containers.append(self._shape_container(container, excluded, include_state))
         except Exception as e:
             print(f"Error getting containers: {e}")
             return []
         
         return containers
     
-    def _format_ports(self, ports: Dict) -> List[str]:
-        """Format port mappings"""
-        formatted_ports = []
-        if ports:
-            for container_port, host_bindings in ports.items():
-                if host_bindings:
-                    for binding in host_bindings:
-                        formatted_ports.append(f"{binding['HostIp']}:{binding['HostPort']}->{container_port}")
-                else:
-                    formatted_ports.append(container_port)
-        return formatted_ports
+    def get_containers_multi(
+        self,
+        patterns: List[str],
+        *,
+        include_state: bool = True,
+        include_labels: bool = True,
+        include_ports: bool = True
+    ) -> List[Dict]:
+        """Get containers matching any of the given name patterns, without duplicates"""
+        unique_containers = {}
+        excluded = self._excluded_fields(include_labels, include_ports)
+        
+        if not patterns:
+            return []
+        
+        try:
+            matches = self._compile_name_filter(patterns)
+            for container in self._get_all_containers_cached():
+                if matches(container["name"]):
+                    unique_containers[container["id"]] = self._shape_container(container, excluded, include_state)
+        except Exception as e:
+            print(f"Error getting containers: {e}")
+            return []
+        
+        return list(unique_containers.values())
+    
+    def _format_ports(self, ports: Optional[List[Dict]]) -> List[str]:
+        """Format port mappings from the container list API"""
+        if not ports:
+            return []
+        return [
+            f"{port.get('IP', '')}:{port['PublicPort']}->{port['PrivatePort']}/{port['Type']}"
+            if port.get("PublicPort") else f"{port['PrivatePort']}/{port['Type']}"
+            for port in ports
+        ]
+    
+    def watch_container_stats(self, container_id: str):
+        """Start streaming stats for a container in the background, if not already running"""
+        if not self._stats_streaming:
+            return
+        
+        with self._stats_streams_lock:
+            thread = self._stats_streams.get(container_id)
+            if thread is not None and thread.is_alive():
+                self._stats_last_access[container_id] = time.monotonic()
+                return
+            
+            # Each stream holds a thread and a daemon connection; past the cap
+            # containers are served by the one-shot path instead
+            if len(self._stats_streams) >= self._stats_max_streams:
+                return
+            
+            self._stats_last_access[container_id] = time.monotonic()
+            thread = threading.Thread(
+                target=self._stream_stats,
+                args=(container_id,),
+                name=f"stats-{container_id[:12]}",
+                daemon=True
+            )
+            self._stats_streams[container_id] = thread
+            thread.start()
+    
+    def _stream_stats(self, container_id: str):
+        """Keep the latest stats snapshot of a container until it stops or nobody asks for it"""
+        client = None
+        try:
+            client = self._create_client()
+            # Docker pushes a snapshot roughly once per second
+            for stats in client.api.stats(container_id, stream=True, decode=True):
+                now = time.monotonic()
+                self._latest_stats[container_id] = (stats, now)
+                if now - self._stats_last_access.get(container_id, 0.0) > self._stats_stream_idle_timeout:
+                    break
+        except Exception as e:
+            print(f"Stats stream for {container_id} stopped: {e}")
+        finally:
+            self._latest_stats.pop(container_id, None)
+            with self._stats_streams_lock:
+                if self._stats_streams.get(container_id) is threading.current_thread():
+                    del self._stats_streams[container_id]
+                    self._stats_last_access.pop(container_id, None)
+            if client is not None:
+                client.close()
+    
+    def _get_streamed_stats(self, container_id: str) -> Optional[Dict]:
+        """Get the latest streamed stats snapshot if it is recent enough"""
+        entry = self._latest_stats.get(container_id)
+        if entry is None or time.monotonic() - entry[1] > self._stats_max_age:
+            return None
+        self._stats_last_access[container_id] = time.monotonic()
+        return entry[0]
     
-    def get_container_metrics(self, container_id: str) -> Dict:
-        """Get detailed metrics for a specific container"""
+    def get_container_metrics(self, container_id: str, timestamp: Optional[str] = None) -> Dict:
+        """Get detailed metrics for a specific container (safe to call from worker threads)
+
+        A batch of containers can pass one pre-formatted timestamp to share.
+        """
+        if timestamp is None:
+            timestamp = datetime.utcnow().isoformat()
+        
         try:
-            container = self.client.containers.get(container_id)
-            stats = container.stats(stream=False)
+            client = self._get_thread_client()
+            inspect = client.api.inspect_container(container_id)
+            full_id = inspect["Id"]
+            
+            stats = self._get_streamed_stats(full_id)
+            if stats is None and self._stats_one_shot:
+                # Single snapshot, no wait for a second sample
+                stats = client.api.stats(full_id, stream=False, one_shot=True)
+                previous = self._last_cpu_sample.get(full_id)
+            else:
+                if stats is None:
+                    # Daemons before API 1.41 only offer the two-sample snapshot
+                    stats = client.api.stats(full_id, stream=False)
+                # Streamed and two-sample snapshots carry their own previous sample
+                precpu_stats = stats["precpu_stats"]
+                previous = None
+                if precpu_stats.get("system_cpu_usage"):
+                    previous = (precpu_stats["cpu_usage"]["total_usage"], precpu_stats["system_cpu_usage"])
+            
+            # Calculate CPU percentage against the previous sample of this container
+            cpu_stats = stats["cpu_stats"]
+            total_usage = cpu_stats["cpu_usage"]["total_usage"]
+            system_usage = cpu_stats["system_cpu_usage"]
+            online_cpus = cpu_stats.get("online_cpus") or len(cpu_stats["cpu_usage"].get("percpu_usage") or [])
+            self._last_cpu_sample[full_id] = (total_usage, system_usage)
             
-            # Calculate CPU percentage
-            cpu_delta = stats["cpu_stats"]["cpu_usage"]["total_usage"] - stats["precpu_stats"]["cpu_usage"]["total_usage"]
-            system_delta = stats["cpu_stats"]["system_cpu_usage"] - stats["precpu_stats"]["system_cpu_usage"]
             cpu_percent = 0.0
-            if system_delta > 0:
-                cpu_percent = (cpu_delta / system_delta) * len(stats["cpu_stats"]["cpu_usage"]["percpu_usage"]) * 100.0
+            if previous:
+                cpu_delta = total_usage - previous[0]
+                system_delta = system_usage - previous[1]
+                if system_delta > 0 and cpu_delta >= 0:
+                    cpu_percent = (cpu_delta / system_delta) * online_cpus * 100.0
             
             # Memory usage
             memory_usage = stats["memory_stats"]["usage"]
@@ -105,8 +457,12 @@ class DockerClient:
                     network_rx += network.get("rx_bytes", 0)
                     network_tx += network.get("tx_bytes", 0)
             
-            # Uptime
-            uptime_seconds = int(time.time() - container.attrs["State"]["StartedAt"])
+            # Uptime (StartedAt is ISO 8601 with a trailing Z)
+            uptime_seconds = 0
+            state = inspect["State"]
+            if state.get("Running"):
+                started_at = datetime.fromisoformat(state["StartedAt"].replace("Z", "+00:00"))
+                uptime_seconds = max(0, int((datetime.now(timezone.utc) - started_at).total_seconds()))
             
             return {
                 "cpu_percent": round(cpu_percent, 2),
@@ -115,9 +471,9 @@ class DockerClient:
                 "memory_limit": memory_limit,
                 "network_rx": network_rx,
                 "network_tx": network_tx,
-                "restart_count": container.attrs["RestartCount"],
+                "restart_count": inspect["RestartCount"],
                 "uptime_seconds": uptime_seconds,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": timestamp
             }
         except Exception as e:
             print(f"Error getting container metrics for {container_id}: {e}")
@@ -130,20 +486,24 @@ class DockerClient:
                 "network_tx": 0,
                 "restart_count": 0,
                 "uptime_seconds": 0,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": timestamp
             }
     
     def get_server_metrics(self) -> Dict:
         """Get server-level metrics"""
         try:
-            # System metrics
-            cpu_percent = psutil.cpu_percent(interval=1)
+            # System metrics (CPU usage since the previous call, without sleeping)
+            cpu_percent = psutil.cpu_percent(interval=None)
             memory = psutil.virtual_memory()
             disk = psutil.disk_usage('/')
             
-            # Docker containers count
-            running_containers = len(self.client.containers.list())
-            total_containers = len(self.client.containers.list(all=True))
+            # Docker containers count, from the cached container list
+            all_containers = self._get_all_containers_cached()
+            total_containers = len(all_containers)
+            # Same set as containers.list() without all=True, which includes paused ones
+            running_containers = sum(
+                1 for c in all_containers if c["status"] in ("running", "paused", "restarting")
+            )
             
             return {
                 "cpu_percent": round(cpu_percent, 2),
@@ -175,49 +535,86 @@ class DockerClient:
     def perform_container_action(self, container_id: str, action: str) -> Dict:
         """Perform action on container"""
         try:
-            container = self.client.containers.get(container_id)
+            container = self._get_thread_client().containers.get(container_id)
+            self.invalidate_containers_cache()
             
-            if action == "start":
-                container.start()
-                return {"success": True, "message": f"Container {container_id} started successfully"}
-            elif action == "stop":
-                container.stop()
-                return {"success": True, "message": f"Container {container_id} stopped successfully"}
-            elif action == "restart":
-                container.restart()
-                return {"success": True, "message": f"Container {container_id} restarted successfully"}
-            elif action == "pause":
-                container.pause()
-                return {"success": True, "message": f"Container {container_id} paused successfully"}
-            elif action == "unpause":
-                container.unpause()
-                return {"success": True, "message": f"Container {container_id} unpaused successfully"}
-            else:
-                return {"success": False, "message": f"Unknown action: {action}"}
+            try:
+                if action == "start":
+                    container.start()
+                    return {"success": True, "message": f"Container {container_id} started successfully"}
+                elif action == "stop":
+                    container.stop()
+                    return {"success": True, "message": f"Container {container_id} stopped successfully"}
+                elif action == "restart":
+                    container.restart()
+                    return {"success": True, "message": f"Container {container_id} restarted successfully"}
+                elif action == "pause":
+                    container.pause()
+                    return {"success": True, "message": f"Container {container_id} paused successfully"}
+                elif action == "unpause":
+                    container.unpause()
+                    return {"success": True, "message": f"Container {container_id} unpaused successfully"}
+                else:
+                    return {"success": False, "message": f"Unknown action: {action}"}
+            finally:
+                # Drop anything cached while the action was running, e.g. a stop waiting on its timeout
+                self.invalidate_containers_cache()
         except Exception as e:
             return {"success": False, "message": f"Failed to perform action: {str(e)}"}
     
     def get_container_logs(self, container_id: str, tail: int = 100) -> str:
         """Get container logs"""
         try:
-            container = self.client.containers.get(container_id)
+            container = self._get_thread_client().containers.get(container_id)
             logs = container.logs(tail=tail, timestamps=True).decode('utf-8')
             return logs
         except Exception as e:
             return f"Error getting logs: {str(e)}"
     
+    def _get_info_cached(self) -> Dict:
+        """Get daemon info, reusing the cached copy while it is fresh"""
+        # Daemon info is effectively static between daemon restarts
+        now = time.monotonic()
+        if self._info_cache is not None and now - self._info_cache_ts < self._info_cache_ttl:
+            return self._info_cache
+        
+        shared = self._shared_cache_get(self._info_cache_key)
+        if shared is not None:
+            info, remaining = shared
+            self._info_cache = info
+            self._info_cache_ts = now - (self._info_cache_ttl - remaining)
+            return info
+        
+        info = self._get_thread_client().info()
+        result = {
+            "version": info.get("ServerVersion", "Unknown"),
+            "images": info.get("Images", 0),
+            "driver": info.get("Driver", "Unknown"),
+            "kernel_version": info.get("KernelVersion", "Unknown"),
+            "operating_system": info.get("OperatingSystem", "Unknown"),
+            "architecture": info.get("Architecture", "Unknown")
+        }
+        self._info_cache = result
+        self._info_cache_ts = now
+        self._shared_cache_set(self._info_cache_key, result, self._info_cache_ttl)
+        return result
+    
     def get_docker_info(self) -> Dict:
-        """Get Docker daemon information"""
+        """Get Docker daemon information
+
+        The containers count comes from the container list cache; the other
+        fields, including the images count, may be up to INFO_CACHE_TTL old.
+        """
         try:
-            info = self.client.info()
+            info = self._get_info_cached()
             return {
-                "version": info.get("ServerVersion", "Unknown"),
-                "containers": info.get("Containers", 0),
-                "images": info.get("Images", 0),
-                "driver": info.get("Driver", "Unknown"),
-                "kernel_version": info.get("KernelVersion", "Unknown"),
-                "operating_system": info.get("OperatingSystem", "Unknown"),
-                "architecture": info.get("Architecture", "Unknown")
+                "version": info["version"],
+                "containers": len(self._get_all_containers_cached()),
+                "images": info["images"],
+                "driver": info["driver"],
+                "kernel_version": info["kernel_version"],
+                "operating_system": info["operating_system"],
+                "architecture": info["architecture"]
             }
         except Exception as e:
             return {"error": f"Failed to get Docker info: {str(e)}"} 
\ No newline at end of file
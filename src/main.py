@@ -1,20 +1,31 @@
 from fastapi import FastAPI, APIRouter, HTTPException, Depends, status, Header, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
+from prometheus_client import CONTENT_TYPE_LATEST
 from typing import Optional, List
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+from datetime import datetime
 import uvicorn
+import hmac
 import os
 from dotenv import load_dotenv
 
 from docker_client import DockerClient
+from prometheus_metrics import render_metrics
 
 # Load environment variables
 load_dotenv()
 
 # Configuration
 AGENT_TOKEN = os.getenv("AGENT_TOKEN", "your-agent-token-change-in-production")
+AGENT_TOKEN_BYTES = AGENT_TOKEN.encode()
 DOCKER_SOCKET = os.getenv("DOCKER_SOCKET", "/var/run/docker.sock")
 HOST = os.getenv("HOST", "0.0.0.0")
 PORT = int(os.getenv("PORT", "8080"))
+STATS_WORKERS = int(os.getenv("STATS_WORKERS", "16"))
+WORKERS = int(os.getenv("WORKERS", "1"))
 
 # Initialize Docker client
 try:
@@ -24,11 +35,15 @@ except Exception as e:
     print(f"Failed to initialize Docker client: {e}")
     docker_client = None
 
+# Thread pool for blocking per-container stats calls
+stats_executor = ThreadPoolExecutor(max_workers=STATS_WORKERS)
+
 # Create FastAPI app
 app = FastAPI(
     title="Docker Monitor Agent",
     description="Lightweight agent for monitoring Docker containers",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -40,6 +55,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger responses (container lists, metrics batches)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Новый роутер с префиксом /api
 router = APIRouter(prefix="/api")
 
@@ -74,8 +92,8 @@ async def verify_token(authorization: Optional[str] = Header(None)):
             detail="Invalid authorization header format"
         )
     
-    token = authorization.replace("Bearer ", "")
-    if token != AGENT_TOKEN:
+    token = authorization[len("Bearer "):]
+    if not hmac.compare_digest(token.encode(), AGENT_TOKEN_BYTES):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token"
@@ -96,7 +114,7 @@ async def health_check():
             }
         
         # Test Docker connection
-        docker_client.client.ping()
+        await asyncio.to_thread(docker_client.ping)
         return {
             "status": "healthy", 
             "docker": "connected",
@@ -113,6 +131,9 @@ async def health_check():
 @router.get("/containers")
 async def get_containers(
     name_filter: Optional[str] = None, 
+    include_state: bool = True,
+    include_labels: bool = True,
+    include_ports: bool = True,
     token: str = Depends(verify_token)
 ):
     """Get all containers with optional name filtering"""
@@ -123,7 +144,13 @@ async def get_containers(
         )
     
     try:
-        containers = docker_client.get_containers(name_filter=name_filter)
+        containers = await asyncio.to_thread(
+            docker_client.get_containers,
+            name_filter=name_filter,
+            include_state=include_state,
+            include_labels=include_labels,
+            include_ports=include_ports
+        )
         return {"containers": containers}
     except Exception as e:
         raise HTTPException(
@@ -142,7 +169,7 @@ async def get_container_metrics(container_id: str, token: str = Depends(verify_t
         )
     
     try:
-        metrics = docker_client.get_container_metrics(container_id)
+        metrics = await asyncio.to_thread(docker_client.get_container_metrics, container_id)
         return metrics
     except Exception as e:
         raise HTTPException(
@@ -161,7 +188,7 @@ async def get_server_metrics(token: str = Depends(verify_token)):
         )
     
     try:
-        metrics = docker_client.get_server_metrics()
+        metrics = await asyncio.to_thread(docker_client.get_server_metrics)
         return metrics
     except Exception as e:
         raise HTTPException(
@@ -187,7 +214,7 @@ async def perform_container_action(container_id: str, action_data: dict, token:
         )
     
     try:
-        result = docker_client.perform_container_action(container_id, action)
+        result = await asyncio.to_thread(docker_client.perform_container_action, container_id, action)
         return result
     except Exception as e:
         raise HTTPException(
@@ -206,7 +233,7 @@ async def get_container_logs(container_id: str, tail: int = 100, token: str = De
         )
     
     try:
-        logs = docker_client.get_container_logs(container_id, tail)
+        logs = await asyncio.to_thread(docker_client.get_container_logs, container_id, tail)
         return {"logs": logs}
     except Exception as e:
         raise HTTPException(
@@ -225,7 +252,7 @@ async def get_docker_info(token: str = Depends(verify_token)):
         )
     
     try:
-        info = docker_client.get_docker_info()
+        info = await asyncio.to_thread(docker_client.get_docker_info)
         return info
     except Exception as e:
         raise HTTPException(
@@ -250,20 +277,12 @@ async def get_monitored_containers(
         # Parse container names from query parameter
         container_names = [name.strip() for name in names.split(',') if name.strip()]
         
-        containers = []
-        for name_pattern in container_names:
-            filtered_containers = docker_client.get_containers(name_filter=name_pattern)
-            containers.extend(filtered_containers)
-        
-        # Remove duplicates by container ID
-        unique_containers = {}
-        for container in containers:
-            unique_containers[container['id']] = container
+        containers = await asyncio.to_thread(docker_client.get_containers_multi, container_names)
         
         return {
-            "containers": list(unique_containers.values()),
+            "containers": containers,
             "monitored_patterns": container_names,
-            "total_found": len(unique_containers)
+            "total_found": len(containers)
         }
     except Exception as e:
         raise HTTPException(
@@ -272,6 +291,36 @@ async def get_monitored_containers(
         )
 
 
+async def collect_containers_metrics(container_names: List[str]) -> List[dict]:
+    """Collect metrics for all containers matching the given name patterns"""
+    # Only id, name and status are needed here
+    containers = await asyncio.to_thread(
+        docker_client.get_containers_multi,
+        container_names,
+        include_state=False,
+        include_labels=False,
+        include_ports=False
+    )
+    
+    # Keep stats streaming for running containers so later scrapes are served from memory
+    for container in containers:
+        if container['status'] == 'running':
+            docker_client.watch_container_stats(container['id'])
+    
+    # Collect stats for all containers concurrently, sharing one batch timestamp
+    timestamp = datetime.utcnow().isoformat()
+    loop = asyncio.get_running_loop()
+    all_metrics = await asyncio.gather(*[
+        loop.run_in_executor(stats_executor, docker_client.get_container_metrics, container['id'], timestamp)
+        for container in containers
+    ])
+    for container, metrics in zip(containers, all_metrics):
+        metrics['name'] = container['name']
+        metrics['status'] = container['status']
+    
+    return list(all_metrics)
+
+
 @router.get("/monitored-containers/metrics")
 async def get_monitored_containers_metrics(
     names: str = Query(..., description="Comma-separated container names or patterns"),
@@ -288,14 +337,7 @@ async def get_monitored_containers_metrics(
         # Parse container names from query parameter
         container_names = [name.strip() for name in names.split(',') if name.strip()]
         
-        all_metrics = []
-        for name_pattern in container_names:
-            containers = docker_client.get_containers(name_filter=name_pattern)
-            for container in containers:
-                metrics = docker_client.get_container_metrics(container['id'])
-                metrics['name'] = container['name']
-                metrics['status'] = container['status']
-                all_metrics.append(metrics)
+        all_metrics = await collect_containers_metrics(container_names)
         
         return {
             "containers_metrics": all_metrics,
@@ -308,6 +350,37 @@ async def get_monitored_containers_metrics(
             detail=f"Failed to get monitored containers metrics: {str(e)}"
         )
 
+
+@router.get("/metrics/prom")
+async def get_prometheus_metrics(
+    names: Optional[str] = Query(None, description="Comma-separated container names or patterns"),
+    token: str = Depends(verify_token)
+):
+    """Get server and monitored container metrics in Prometheus text format"""
+    if docker_client is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Docker client not available"
+        )
+    
+    try:
+        server_metrics = await asyncio.to_thread(docker_client.get_server_metrics)
+        
+        containers_metrics = []
+        if names:
+            container_names = [name.strip() for name in names.split(',') if name.strip()]
+            containers_metrics = await collect_containers_metrics(container_names)
+        
+        return Response(
+            content=render_metrics(server_metrics, containers_metrics),
+            media_type=CONTENT_TYPE_LATEST
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to get Prometheus metrics: {str(e)}"
+        )
+
 # В самом конце файла:
 app.include_router(router)
 
@@ -316,5 +389,6 @@ if __name__ == "__main__":
         "main:app",
         host=HOST,
         port=PORT,
+        workers=WORKERS,
         reload=False
     ) 
\ No newline at end of file
@@ -0,0 +1,44 @@
+from prometheus_client import CollectorRegistry, Gauge, generate_latest
+from typing import List, Dict
+
+
+# Server-level gauges: (metric name, help text, key in get_server_metrics result)
+SERVER_GAUGES = [
+    ("server_cpu_percent", "Server CPU usage in percent", "cpu_percent"),
+    ("server_memory_percent", "Server memory usage in percent", "memory_percent"),
+    ("server_memory_usage_bytes", "Server memory used in bytes", "memory_usage"),
+    ("server_memory_total_bytes", "Server memory total in bytes", "memory_total"),
+    ("server_disk_usage_percent", "Root filesystem usage in percent", "disk_usage_percent"),
+    ("server_disk_usage_bytes", "Root filesystem used in bytes", "disk_usage"),
+    ("server_disk_total_bytes", "Root filesystem size in bytes", "disk_total"),
+    ("server_running_containers", "Number of running containers", "running_containers"),
+    ("server_total_containers", "Number of containers", "total_containers"),
+]
+
+# Per-container gauges: (metric name, help text, key in get_container_metrics result)
+CONTAINER_GAUGES = [
+    ("container_cpu_percent", "Container CPU usage in percent", "cpu_percent"),
+    ("container_memory_percent", "Container memory usage in percent of its limit", "memory_percent"),
+    ("container_memory_usage_bytes", "Container memory used in bytes", "memory_usage"),
+    ("container_memory_limit_bytes", "Container memory limit in bytes", "memory_limit"),
+    ("container_network_rx_bytes", "Bytes received over all container networks", "network_rx"),
+    ("container_network_tx_bytes", "Bytes sent over all container networks", "network_tx"),
+    ("container_restart_count", "Number of container restarts", "restart_count"),
+    ("container_uptime_seconds", "Seconds since the container started", "uptime_seconds"),
+]
+
+
+def render_metrics(server_metrics: Dict, containers_metrics: List[Dict]) -> bytes:
+    """Render server and container metrics in the Prometheus text exposition format"""
+    # A fresh registry per scrape, so containers that went away drop out
+    registry = CollectorRegistry()
+    
+    for metric_name, description, key in SERVER_GAUGES:
+        Gauge(metric_name, description, registry=registry).set(server_metrics.get(key, 0))
+    
+    for metric_name, description, key in CONTAINER_GAUGES:
+        gauge = Gauge(metric_name, description, labelnames=["name"], registry=registry)
+        for metrics in containers_metrics:
+            gauge.labels(name=metrics["name"]).set(metrics.get(key, 0))
+    
+    return generate_latest(registry)
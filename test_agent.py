@@ -89,6 +89,14 @@ def main():
     print("\n8. Testing metrics endpoint:")
     test_endpoint("/metrics")
     
+    # Test containers endpoint without heavy fields
+    print("\n9. Testing containers endpoint without state, labels and ports:")
+    test_endpoint("/containers?include_state=false&include_labels=false&include_ports=false")
+    
+    # Test Prometheus metrics endpoint
+    print("\n10. Testing Prometheus metrics endpoint:")
+    test_endpoint("/metrics/prom?names=agent,nginx")
+    
     print("\n" + "-" * 50)
     print("Testing completed!")
 